@@ -1,15 +1,25 @@
 """
 birdhouse — generate and export CAD geometry for a simple laser-cut birdhouse.
 
-This module builds CadQuery solids for a simple birdhouse (front, back and side
-plates), applies connector cutouts and entrance holes, exports 2D DXF files for
-laser cutting, and displays the parts in the ocp_vscode viewer.
+This module exports 2D DXF files for laser cutting from the profiles in
+profiles.py and, on request, builds CadQuery solids for a simple birdhouse
+(front, back and side plates, roofs and slides) and displays them in the
+ocp_vscode viewer.
 
 Primary outputs / side effects:
-- Creates CadQuery solids: front_plate, back_plate, side_plate, side_plate2.
-- Exports DXF files to: construction_files/front_plate.dxf,
-  construction_files/side_plate.dxf, construction_files/back_plate.dxf.
-- Calls show_object(...) to display parts in the ocp_vscode viewer.
+- export_profiles() exports DXF files to construction_files/ (front, back and side
+  plates, roofs and slides) straight from 2D sketches; no 3D Boolean operations are
+  involved. The files are written by export_all(...) from exports.py.
+- Builder functions create the 3D CadQuery solids: build_front_plate(),
+  build_back_plate(), build_slides() / place_slides() and build_roof_left() /
+  build_roofs(). Each builder is memoized, so repeated calls within one process
+  return the already built part. The side plates come from build_side_plate(...)
+  in plates.py. They are only used for the 3D preview.
+- With --check, main() calls check_profiles() before the export and fails if a
+  profile no longer matches its 3D part.
+- With --preview-3d, main() calls show_preview() to display the 3D parts in the
+  ocp_vscode viewer unless the environment variable OCP_VIEWER is set to
+  something other than "1".
 
 Key behavior and dependencies:
 - Uses constants from constants.py: WALLTHICKNESS, BIRDHOUSE_WIDTH,
@@ -21,16 +31,36 @@ Key behavior and dependencies:
   need adjustment for other manufacturing tolerances.
 
 Notes:
-- Running this module will produce files and viewer output as described above.
+- Importing this module has no side effects; running it as a script calls main()
+  and produces files and viewer output as described above.
+  Without --preview-3d (or with OCP_VIEWER=0) only the DXF files are written and
+  ocp_vscode is not imported at all.
+- The 2D profiles in profiles.py and the 3D builders describe the same parts;
+  check_profiles() (or --check) verifies that extruding each profile gives its
+  3D part.
 - To change layout or spacing, modify the constants or the connector logic in
   connectors.py.
 """
 
-from cadquery import cq, exporters
-
-from ocp_vscode import show, show_object
-
-from connectors import distribute_connectors
+import argparse
+import functools
+import os
+from typing import Optional, Sequence, Tuple
+
+from cadquery import cq
+
+from connectors import attach_connectors, distribute_connectors
+from exports import export_all
+from placements import SLIDE_PLACEMENTS
+from plates import build_side_plate
+from profiles import (
+    back_plate_profile,
+    front_plate_profile,
+    roof_left_profile,
+    roof_right_profile,
+    side_plate_profile,
+    slide_profiles,
+)
 from constants import (
     WALLTHICKNESS,
     BIRDHOUSE_WIDTH,
@@ -40,226 +70,352 @@ from constants import (
     SLIDE_LENGTH_MID,
     SLIDE_LENGTH_TOP,
     SLIDE_LENGTH_BOTTOM,
-    SLIDE_ANGLE,
     FRONT_PLATE_HEIGHT_SIDE,
     FRONT_PLATE_HEIGHT_MIDDLE,
     BACK_PLATE_HEIGHT,
     SIDE_PLATE_HEIGHT,
     ROOF_LENGTH,
+    ROOF_ANGLE,
+    ENTRANCE_HOLE_RADIUS,
+    ENTRANCE_HOLE_HEIGHTS,
 )
 
-# Create front plate with entrance holes
-front_plate = (
-    cq.Workplane("XZ")
-    .lineTo(0, FRONT_PLATE_HEIGHT_SIDE)
-    .lineTo(-WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE)
-    .lineTo(BIRDHOUSE_WIDTH_INNER / 2, FRONT_PLATE_HEIGHT_MIDDLE)
-    .lineTo(BIRDHOUSE_WIDTH_INNER + WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE)
-    .lineTo(BIRDHOUSE_WIDTH_INNER, FRONT_PLATE_HEIGHT_SIDE)
-    .lineTo(BIRDHOUSE_WIDTH_INNER, 0)
-    .close()
-    .moveTo(BIRDHOUSE_WIDTH_INNER / 2, FRONT_PLATE_HEIGHT_MIDDLE * 0.5)
-    .circle(BIRDHOUSE_WIDTH_INNER / 6)
-    .moveTo(BIRDHOUSE_WIDTH_INNER / 2, FRONT_PLATE_HEIGHT_MIDDLE * 0.75)
-    .circle(BIRDHOUSE_WIDTH_INNER / 6)
-    .extrude(WALLTHICKNESS)
-)
+# set OCP_VIEWER=0 to suppress the viewer even with --preview-3d
+VIEWER_ENABLED = os.environ.get("OCP_VIEWER", "1") == "1"
 
-# add connectors to front plate
-front_plate_connectors = distribute_connectors(FRONT_PLATE_HEIGHT_SIDE, start=0).rotate(
-    (0, 0, 0), (1, 0, 0), 90
-)
-front_plate = front_plate + front_plate_connectors
-front_plate = front_plate + front_plate_connectors.translate(
-    (BIRDHOUSE_WIDTH_INNER, 0, 0)
-)
-front_plate = front_plate.translate(
-    (WALLTHICKNESS, WALLTHICKNESS, BIRDHOUSE_SPACE_BOTTOM)
-)
 
+def _with_side_connectors(plate: cq.Workplane, connectors: cq.Workplane) -> cq.Workplane:
+    """Fuse a connector row onto both long edges of a plate in a single fuse."""
+    return attach_connectors(
+        plate, connectors, connectors.translate((BIRDHOUSE_WIDTH_INNER, 0, 0))
+    )
 
-# Create back plate
-back_plate = (
-    cq.Workplane("XZ")
-    .moveTo(0, 0)
-    .lineTo(0, BACK_PLATE_HEIGHT)
-    .lineTo(BIRDHOUSE_WIDTH_INNER, BACK_PLATE_HEIGHT)
-    .lineTo(BIRDHOUSE_WIDTH_INNER, 0)
-    .close()
-    .extrude(WALLTHICKNESS)
-)
-# add connectors to side plate
-back_plate_connectors = distribute_connectors(FRONT_PLATE_HEIGHT_SIDE, start=1).rotate(
-    (0, 0, 0), (1, 0, 0), 90
-)
-back_plate = back_plate + back_plate_connectors
-back_plate = back_plate + back_plate_connectors.translate((BIRDHOUSE_WIDTH_INNER, 0, 0))
-back_plate = back_plate.translate((WALLTHICKNESS, BIRDHOUSE_DEPTH, 0))
-
-# Create side plates
-side_plate = (
-    cq.Workplane("YZ")
-    .lineTo(0, SIDE_PLATE_HEIGHT)
-    .lineTo(BIRDHOUSE_DEPTH, SIDE_PLATE_HEIGHT)
-    .lineTo(BIRDHOUSE_DEPTH, 0)
-    .close()
-    .extrude(WALLTHICKNESS)
-)
 
+@functools.lru_cache(maxsize=None)
+def build_front_plate() -> cq.Workplane:
+    """Create the front plate with entrance holes and connectors, in final position."""
+    front_plate = (
+        cq.Workplane("XZ")
+        .lineTo(0, FRONT_PLATE_HEIGHT_SIDE)
+        .lineTo(-WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE)
+        .lineTo(BIRDHOUSE_WIDTH_INNER / 2, FRONT_PLATE_HEIGHT_MIDDLE)
+        .lineTo(BIRDHOUSE_WIDTH_INNER + WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE)
+        .lineTo(BIRDHOUSE_WIDTH_INNER, FRONT_PLATE_HEIGHT_SIDE)
+        .lineTo(BIRDHOUSE_WIDTH_INNER, 0)
+        .close()
+        .pushPoints([(BIRDHOUSE_WIDTH_INNER / 2, z) for z in ENTRANCE_HOLE_HEIGHTS])
+        .circle(ENTRANCE_HOLE_RADIUS)
+        .extrude(WALLTHICKNESS)
+    )
 
-# Create bottom slide
-bottom_slide = (
-    cq.Workplane("XY")
-    .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_BOTTOM, centered=False)
-    .extrude(WALLTHICKNESS)
-)
+    # add connectors to front plate
+    front_plate_connectors = distribute_connectors(
+        FRONT_PLATE_HEIGHT_SIDE, start=0
+    ).rotate((0, 0, 0), (1, 0, 0), 90)
+    front_plate = _with_side_connectors(front_plate, front_plate_connectors)
 
-# add connectors to bottom slide
-bottom_slide_connectors = distribute_connectors(SLIDE_LENGTH_BOTTOM, start=0)
-bottom_slide = bottom_slide + bottom_slide_connectors
-bottom_slide = bottom_slide + bottom_slide_connectors.translate(
-    (BIRDHOUSE_WIDTH_INNER, 0, 0)
-)
+    return _place_front_plate(front_plate)
 
-exporters.export(bottom_slide, "construction_files/bottom_slide.dxf")
 
-# rotate and translate bottom slide to final position
-bottom_slide = bottom_slide.rotate(
-    (0, 0, 0),
-    (1, 0, 0),
-    SLIDE_ANGLE,
-).translate((WALLTHICKNESS, 0, 0))
+def _place_front_plate(part: cq.Workplane) -> cq.Workplane:
+    """Translate a part of the front plate on the XZ plane to its final position."""
+    return part.translate((WALLTHICKNESS, WALLTHICKNESS, BIRDHOUSE_SPACE_BOTTOM))
 
 
-# Create mid slide
-mid_slide = (
-    cq.Workplane("XY")
-    .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_MID, centered=False)
-    .extrude(WALLTHICKNESS)
-)
+@functools.lru_cache(maxsize=None)
+def build_back_plate() -> cq.Workplane:
+    """Create the back plate with connectors, in final position."""
+    back_plate = (
+        cq.Workplane("XZ")
+        .moveTo(0, 0)
+        .lineTo(0, BACK_PLATE_HEIGHT)
+        .lineTo(BIRDHOUSE_WIDTH_INNER, BACK_PLATE_HEIGHT)
+        .lineTo(BIRDHOUSE_WIDTH_INNER, 0)
+        .close()
+        .extrude(WALLTHICKNESS)
+    )
 
-# add connectors to mid slide
-mid_slide_connectors = distribute_connectors(SLIDE_LENGTH_MID, start=1)
-mid_slide = mid_slide + mid_slide_connectors
-mid_slide = mid_slide + mid_slide_connectors.translate((BIRDHOUSE_WIDTH_INNER, 0, 0))
+    # add connectors to back plate
+    back_plate_connectors = distribute_connectors(
+        FRONT_PLATE_HEIGHT_SIDE, start=1
+    ).rotate((0, 0, 0), (1, 0, 0), 90)
+    back_plate = _with_side_connectors(back_plate, back_plate_connectors)
 
-exporters.export(mid_slide, "construction_files/mid_slide.dxf")
+    return _place_back_plate(back_plate)
 
-# rotate and translate mid slide to final position
-mid_slide = mid_slide.rotate(
-    (0, 0, 0),
-    (1, 0, 0),
-    -SLIDE_ANGLE,
-).translate((WALLTHICKNESS, WALLTHICKNESS, BACK_PLATE_HEIGHT * 0.7))
 
+def _place_back_plate(part: cq.Workplane) -> cq.Workplane:
+    """Translate a part of the back plate on the XZ plane to its final position."""
+    return part.translate((WALLTHICKNESS, BIRDHOUSE_DEPTH, 0))
+
+
+@functools.lru_cache(maxsize=None)
+def build_slides() -> Tuple[cq.Workplane, cq.Workplane, cq.Workplane]:
+    """Create the bottom, mid and top slide with connectors, flat on the XY plane."""
+    # Create bottom slide
+    bottom_slide = (
+        cq.Workplane("XY")
+        .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_BOTTOM, centered=False)
+        .extrude(WALLTHICKNESS)
+    )
+    bottom_slide = _with_side_connectors(
+        bottom_slide, distribute_connectors(SLIDE_LENGTH_BOTTOM, start=0)
+    )
+
+    # Create mid slide
+    mid_slide = (
+        cq.Workplane("XY")
+        .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_MID, centered=False)
+        .extrude(WALLTHICKNESS)
+    )
+    mid_slide = _with_side_connectors(
+        mid_slide, distribute_connectors(SLIDE_LENGTH_MID, start=1)
+    )
+
+    # Create top slide
+    top_slide = (
+        cq.Workplane("XY")
+        .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_TOP, centered=False)
+        .extrude(WALLTHICKNESS)
+    )
+    top_slide = _with_side_connectors(
+        top_slide, distribute_connectors(SLIDE_LENGTH_TOP, start=0)
+    )
+
+    return bottom_slide, mid_slide, top_slide
 
-# Create top slide
-top_slide = (
-    cq.Workplane("XY")
-    .rect(BIRDHOUSE_WIDTH_INNER, SLIDE_LENGTH_TOP, centered=False)
-    .extrude(WALLTHICKNESS)
-)
 
-# add connectors to top slide
-top_slide_connectors = distribute_connectors(SLIDE_LENGTH_TOP, start=0)
-top_slide = top_slide + top_slide_connectors
-top_slide = top_slide + top_slide_connectors.translate((BIRDHOUSE_WIDTH_INNER, 0, 0))
+def _place_slide(name: str, slide: cq.Workplane) -> cq.Workplane:
+    """Move a flat slide to its final position as given by SLIDE_PLACEMENTS[name]."""
+    angle, shift, (offset_y, offset_z) = SLIDE_PLACEMENTS[name]
+    return (
+        slide.translate((0, shift, 0))
+        .rotate((0, 0, 0), (1, 0, 0), angle)
+        .translate((WALLTHICKNESS, offset_y, offset_z))
+    )
 
-exporters.export(top_slide, "construction_files/top_slide.dxf")
 
-# rotate and translate top slide to final position
-top_slide = (
-    top_slide.translate((0, -SLIDE_LENGTH_TOP, 0))
-    .rotate(
-        (0, 0, 0),
-        (1, 0, 0),
-        SLIDE_ANGLE,
+@functools.lru_cache(maxsize=None)
+def place_slides() -> Tuple[cq.Workplane, cq.Workplane, cq.Workplane]:
+    """Move the slides from build_slides() to their final position, see placements.py."""
+    bottom_slide, mid_slide, top_slide = build_slides()
+    return (
+        _place_slide("bottom", bottom_slide),
+        _place_slide("mid", mid_slide),
+        _place_slide("top", top_slide),
     )
-    .translate(
+
+
+def _roof_left_connectors() -> cq.Workplane:
+    """Create the connectors along the ridge edge of the flat left roof plate."""
+    return distribute_connectors(BIRDHOUSE_DEPTH, start=1).translate((ROOF_LENGTH, 0, 0))
+
+
+def _place_roof_left(part: cq.Workplane) -> cq.Workplane:
+    """Rotate and translate a part of the flat left roof to its final position."""
+    return part.rotate((0, 0, 0), (0, 1, 0), -ROOF_ANGLE).translate(
+        (0, 0, SIDE_PLATE_HEIGHT)
+    )
+
+
+def _place_roof_right(part: cq.Workplane) -> cq.Workplane:
+    """Rotate and translate a part of the flat right roof to its final position."""
+    return (
+        part.translate((-ROOF_LENGTH - WALLTHICKNESS, 0, 0))
+        .rotate((0, 0, 0), (0, 1, 0), ROOF_ANGLE)
+        .translate((BIRDHOUSE_WIDTH, 0, SIDE_PLATE_HEIGHT))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def build_roof_left() -> cq.Workplane:
+    """Create the left roof plate with connectors, flat on the XY plane."""
+    roof_left = (
+        cq.Workplane("XY")
+        .rect(ROOF_LENGTH, BIRDHOUSE_DEPTH, centered=False)
+        .extrude(WALLTHICKNESS)
+    )
+    return attach_connectors(roof_left, _roof_left_connectors())
+
+
+@functools.lru_cache(maxsize=None)
+def build_roofs() -> Tuple[cq.Workplane, cq.Workplane]:
+    """Create the left and right roof plates in final position."""
+    roof_left = _place_roof_left(build_roof_left())
+
+    # Create right roof plate
+    roof_right = _place_roof_right(
+        cq.Workplane("XY")
+        .rect(ROOF_LENGTH + WALLTHICKNESS, BIRDHOUSE_DEPTH, centered=False)
+        .extrude(WALLTHICKNESS)
+    )
+
+    # the left roof plate ends at the ridge, only its connectors reach into the right
+    # roof plate; cutting the small connector prisms gives the same slots as cutting
+    # the whole left roof
+    roof_right = roof_right.cut(_place_roof_left(_roof_left_connectors()))
+
+    return roof_left, roof_right
+
+
+def export_profiles() -> None:
+    """Export the 2D profiles from profiles.py as DXF files for laser cutting."""
+    bottom_slide, mid_slide, top_slide = slide_profiles()
+    export_all(
+        [
+            (bottom_slide, "construction_files/bottom_slide.dxf"),
+            (mid_slide, "construction_files/mid_slide.dxf"),
+            (top_slide, "construction_files/top_slide.dxf"),
+            (roof_left_profile(), "construction_files/roof_left.dxf"),
+            (roof_right_profile(), "construction_files/roof_right.dxf"),
+            (front_plate_profile(), "construction_files/front_plate.dxf"),
+            (side_plate_profile(), "construction_files/side_plate.dxf"),
+            (back_plate_profile(), "construction_files/back_plate.dxf"),
+        ]
+    )
+
+
+def _extrude_profile(profile: cq.Sketch, plane: str = "XY") -> cq.Workplane:
+    """Extrude a 2D profile by WALLTHICKNESS on the given named plane."""
+    return cq.Workplane(plane).placeSketch(profile).extrude(WALLTHICKNESS)
+
+
+def _volume_difference(a: cq.Workplane, b: cq.Workplane) -> float:
+    """Return the volume of the symmetric difference of two single-shape Workplanes."""
+    # cut copies, the booleans would otherwise add pcurves to the memoized parts
+    shape_a = a.val().copy()
+    shape_b = b.val().copy()
+    return shape_a.cut(shape_b).Volume() + shape_b.cut(shape_a).Volume()
+
+
+def check_profiles(tolerance: float = 1e-3) -> None:
+    """
+    Check that the 2D profiles used for the DXF export match the 3D parts.
+    ----------
+    Parameters
+    ----------
+    tolerance : float, optional
+        Largest accepted volume of the symmetric difference per part (default: 1e-3).
+    Raises
+    ------
+    ValueError
+        If the extruded profile of any part differs from its 3D part; the message lists
+        the affected parts and their difference volume.
+    Notes
+    -----
+    - Each profile is extruded by WALLTHICKNESS on the plane of its 3D part and moved
+      like that part, so a drift between profiles.py and the 3D builders is caught.
+    """
+    front_plate = build_front_plate()
+    back_plate = build_back_plate()
+    side_plate, _ = build_side_plate(front_plate, back_plate, place_slides())
+    _, roof_right = build_roofs()
+
+    pairs = [
         (
-            WALLTHICKNESS,
-            BIRDHOUSE_DEPTH - WALLTHICKNESS,
-            BACK_PLATE_HEIGHT - WALLTHICKNESS,
+            "front_plate",
+            _place_front_plate(_extrude_profile(front_plate_profile(), "XZ")),
+            front_plate,
+        ),
+        (
+            "back_plate",
+            _place_back_plate(_extrude_profile(back_plate_profile(), "XZ")),
+            back_plate,
+        ),
+        ("side_plate", _extrude_profile(side_plate_profile(), "YZ"), side_plate),
+        ("roof_left", _extrude_profile(roof_left_profile()), build_roof_left()),
+        ("roof_right", _place_roof_right(_extrude_profile(roof_right_profile())), roof_right),
+    ]
+    pairs += [
+        (f"{name}_slide", _extrude_profile(profile), slide)
+        for name, profile, slide in zip(
+            ("bottom", "mid", "top"), slide_profiles(), build_slides()
+        )
+    ]
+
+    mismatches = []
+    for name, expected, actual in pairs:
+        difference = _volume_difference(expected, actual)
+        if difference > tolerance:
+            mismatches.append(f"{name} ({difference:.3f})")
+    if mismatches:
+        raise ValueError(
+            "2D profiles differ from the 3D parts: " + ", ".join(mismatches)
         )
-    )
-)
 
 
-# cut out connector shapes from side plates
-side_plate = side_plate - front_plate
-side_plate = side_plate - back_plate
-side_plate = side_plate - bottom_slide
-side_plate = side_plate - mid_slide
-side_plate = side_plate - top_slide
-side_plate2 = side_plate.translate((BIRDHOUSE_WIDTH - WALLTHICKNESS, 0, 0))
+def show_preview() -> None:
+    """Build the 3D model and show it in the ocp_vscode viewer."""
+    from ocp_vscode import show  # pylint: disable=import-outside-toplevel
 
+    front_plate = build_front_plate()
+    back_plate = build_back_plate()
+    bottom_slide, mid_slide, top_slide = place_slides()
+    side_plate, side_plate2 = build_side_plate(
+        front_plate, back_plate, (bottom_slide, mid_slide, top_slide)
+    )
+    roof_left, roof_right = build_roofs()
+
+    show(
+        front_plate,
+        back_plate,
+        side_plate,
+        side_plate2,
+        roof_left,
+        roof_right,
+        bottom_slide,
+        mid_slide,
+        top_slide,
+        names=[
+            "Front Plate",
+            "Back Plate",
+            "Side Plate Left",
+            "Side Plate Right",
+            "Left Roof",
+            "Right Roof",
+            "Bottom Slide",
+            "Middle Slide",
+            "Top Slide",
+        ],
+        colors=[
+            "#A04800",
+            "#A04800",
+            "#A02D00",
+            "#A02D00",
+            "#805700",
+            "#805700",
+            "#806D00",
+            "#806D00",
+            "#806D00",
+        ],
+    )
 
-# Create left roof plate
-roof_left = (
-    cq.Workplane("XY")
-    .rect(ROOF_LENGTH, BIRDHOUSE_DEPTH, centered=False)
-    .extrude(WALLTHICKNESS)
-)
 
-roof_left_connectors = distribute_connectors(BIRDHOUSE_DEPTH, start=1).translate(
-    (ROOF_LENGTH, 0, 0)
-)
-roof_left = roof_left + roof_left_connectors
-exporters.export(roof_left, "construction_files/roof_left.dxf")
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Export the DXF files and, with --preview-3d, show the 3D model in the viewer."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--preview-3d",
+        action="store_true",
+        help="also build the 3D model and show it in the ocp_vscode viewer",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="check that the exported 2D profiles match the 3D model",
+    )
+    args = parser.parse_args(argv)
 
-# rotate and translate roof to final position
-roof_left = roof_left.rotate((0, 0, 0), (0, 1, 0), -45).translate(
-    (0, 0, SIDE_PLATE_HEIGHT)
-)
+    if args.check:
+        check_profiles()
 
-# Create right roof plate
-roof_right = (
-    cq.Workplane("XY")
-    .rect(ROOF_LENGTH + WALLTHICKNESS, BIRDHOUSE_DEPTH, centered=False)
-    .extrude(WALLTHICKNESS)
-    .translate((-ROOF_LENGTH - WALLTHICKNESS, 0, 0))
-)
+    # export models as dxf for laser cutting
+    export_profiles()
 
-# rotate and translate roof to final position
-roof_right = roof_right.rotate((0, 0, 0), (0, 1, 0), 45).translate(
-    (BIRDHOUSE_WIDTH, 0, SIDE_PLATE_HEIGHT)
-)
-roof_right = roof_right - roof_left
+    # show models in viewer
+    if args.preview_3d and VIEWER_ENABLED:
+        show_preview()
 
-exporters.export(
-    roof_right.translate((-BIRDHOUSE_WIDTH, 0, SIDE_PLATE_HEIGHT)).rotate(
-        (0, 0, 0), (0, 1, 0), -45
-    ),
-    "construction_files/roof_right.dxf",
-)
 
-# export models as dxf for laser cutting
-exporters.export(front_plate, "construction_files/front_plate.dxf")
-exporters.export(side_plate, "construction_files/side_plate.dxf")
-exporters.export(back_plate, "construction_files/back_plate.dxf")
-
-
-# show models in viewer
-show(
-    front_plate,
-    back_plate,
-    side_plate,
-    side_plate2,
-    roof_left,
-    roof_right,
-    bottom_slide,
-    mid_slide,
-    top_slide,
-    names=[
-        "Front Plate",
-        "Back Plate",
-        "Side Plate Left",
-        "Side Plate Right",
-        "Left Roof",
-        "Right Roof",
-        "Bottom Slide",
-        "Middle Slide",
-        "Top Slide",
-    ],
-    colors=["#A04800", "#A04800", "#A02D00", "#A02D00", "#805700", "#805700", "#806D00", "#806D00", "#806D00"],
-)
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,26 @@ length, an empty cq.Workplane("front") is returned.
 Notes:
 - Count is computed as int(length / (2 * WALLTHICKNESS)); any partial remaining
   space is ignored.
+- Results are memoized per (length, start); repeated calls only wrap a copy of the
+  cached shape in a new Workplane.
+- connector_positions(length, start) returns the connector centers along an edge,
+  for building 2D profiles without the 3D solids.
+- attach_connectors(plate, *rows) fuses connector rows onto a plate in a single
+  multi-tool OCCT fuse.
 - Intended for use with CadQuery and the WALLTHICKNESS constant from constants.py.
 """
 
+import functools
+from typing import List, Optional
+
+import numpy as np
 from cadquery import cq
+from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse  # pylint: disable=no-name-in-module
+from OCP.TopTools import TopTools_ListOfShape  # pylint: disable=no-name-in-module
+
+from constants import WALLTHICKNESS, CONNECTOR_PITCH
 
-from constants import WALLTHICKNESS
+_HALF_WALLTHICKNESS = WALLTHICKNESS / 2
 
 
 def distribute_connectors(length: float, start: int = 1) -> cq.Workplane:
@@ -38,7 +52,8 @@ def distribute_connectors(length: float, start: int = 1) -> cq.Workplane:
     Returns
     -------
     cq.Workplane
-        A CadQuery Workplane (on the "front" plane) that is the union of all connector solids.
+        A CadQuery Workplane (on the "front" plane) holding all connector solids as a single
+        compound of disjoint prisms.
         If no connectors fit into the given length, an empty cq.Workplane("front") is returned.
     Notes
     -----
@@ -46,32 +61,92 @@ def distribute_connectors(length: float, start: int = 1) -> cq.Workplane:
       imported as `cq`.
     - Each connector is a rectangular prism with XY dimensions (2*WALLTHICKNESS, WALLTHICKNESS)
       and an extrusion depth of WALLTHICKNESS.
+    - The geometry is cached per (length rounded to 6 decimals, start); every call returns a
+      new Workplane around a copy of the cached shape.
     - No explicit validation is performed on WALLTHICKNESS; if WALLTHICKNESS is zero or negative,
       behavior will be incorrect (typically resulting in zero connectors).
     Example
     -------
     >>> # assuming WALLTHICKNESS = 2.0 and cq imported
     >>> wp = distribute_connectors(20.0)
-    >>> # wp is a Workplane containing the unioned connector solids
+    >>> # wp is a Workplane containing the connector solids
     """
-    # number of pieces that fit with spacing = 2 * WALLTHICKNESS
-    count = int(length / (WALLTHICKNESS * 2))
-    pieces = []
-    for i in range(count):
-        # place first center at WALLTHICKNESS/2, then every 2*WALLTHICKNESS after that
-        y = WALLTHICKNESS * (i * 2 + start) + WALLTHICKNESS / 2
-        pieces.append(
-            cq.Workplane("front")
-            .moveTo(0, y)
-            .rect(WALLTHICKNESS * 2, WALLTHICKNESS)
-            .extrude(WALLTHICKNESS)
-        )
-
-    if not pieces:
+    shape = _connector_shape(round(length, 6), start)
+    if shape is None:
         return cq.Workplane("front")
 
-    connectors = pieces[0]
-    for p in pieces[1:]:
-        connectors = connectors.union(p)
+    # hand out a copy: booleans on the result add pcurves to its edges in place,
+    # which would otherwise leak into the cached shape
+    return cq.Workplane("front").add(shape.copy())
+
+
+def connector_positions(length: float, start: int = 1) -> List[float]:
+    """
+    Return the connector center positions along an edge of the given length.
+    Uses the same placement pattern as distribute_connectors; an empty list is returned
+    if no connectors fit into the given length.
+    """
+    # number of pieces that fit with spacing = 2 * WALLTHICKNESS
+    count = int(length / CONNECTOR_PITCH)
+    if count <= 0:
+        return []
+
+    # place first center at WALLTHICKNESS/2, then every 2*WALLTHICKNESS after that
+    first = WALLTHICKNESS * start + _HALF_WALLTHICKNESS
+    # Sketch.push expects plain Python floats
+    return (first + np.arange(count) * CONNECTOR_PITCH).tolist()
+
+
+@functools.lru_cache(maxsize=None)
+def _connector_shape(length: float, start: int) -> Optional[cq.Shape]:
+    """
+    Build the connector compound for distribute_connectors, memoized on (length, start).
+    Returns None if no connectors fit into the given length.
+    """
+    ys = connector_positions(length, start)
+    if not ys:
+        return None
+
+    # the pieces do not overlap, so one sketch holds all of them and is extruded once
+    sketch = cq.Sketch().push([(0, y) for y in ys]).rect(CONNECTOR_PITCH, WALLTHICKNESS)
+    return cq.Workplane("front").placeSketch(sketch).extrude(WALLTHICKNESS).val()
+
+
+def attach_connectors(plate: cq.Workplane, *rows: cq.Workplane) -> cq.Workplane:
+    """
+    Fuse connector rows onto a plate in one Boolean operation.
+    ----------
+    Parameters
+    ----------
+    plate : cq.Workplane
+        The plate the connectors are attached to.
+    *rows : cq.Workplane
+        Connector rows as returned by distribute_connectors, already moved into place.
+    Returns
+    -------
+    cq.Workplane
+        A Workplane on the plane of `plate` holding the fused and cleaned shape.
+    Notes
+    -----
+    - Every connector solid is passed to BRepAlgoAPI_Fuse as a separate tool, so OCCT
+      intersects all of them against the plate in a single run instead of one fuse per row.
+    - Raises RuntimeError if OCCT reports that the fuse failed.
+    """
+    arguments = TopTools_ListOfShape()
+    for shape in plate.vals():
+        arguments.Append(shape.wrapped)
+
+    tools = TopTools_ListOfShape()
+    for row in rows:
+        for solid in row.solids().vals():
+            tools.Append(solid.wrapped)
+
+    fuse = BRepAlgoAPI_Fuse()
+    fuse.SetArguments(arguments)
+    fuse.SetTools(tools)
+    fuse.SetRunParallel(True)
+    fuse.Build()
+    if not fuse.IsDone():
+        raise RuntimeError("fusing connectors onto plate failed")
 
-    return connectors
+    return plate.newObject([cq.Shape.cast(fuse.Shape()).clean()])
@@ -15,6 +15,7 @@ BIRDHOUSE_SPACE_BOTTOM = 40.0  # mm
 
 ROOF_HEIGHT = BIRDHOUSE_WIDTH / 2  # mm
 ROOF_LENGTH = math.sqrt((BIRDHOUSE_WIDTH / 2) ** 2 + (ROOF_HEIGHT) ** 2)
+ROOF_ANGLE = math.degrees(math.atan(ROOF_HEIGHT / (BIRDHOUSE_WIDTH / 2)))  # degrees
 
 SLIDE_LENGTH_MID = 20.0  # mm
 SLIDE_LENGTH_TOP = SLIDE_LENGTH_MID
@@ -29,3 +30,12 @@ FRONT_PLATE_HEIGHT_MIDDLE = BIRDHOUSE_HEIGHT - BIRDHOUSE_SPACE_BOTTOM
 FRONT_PLATE_HEIGHT_SIDE = FRONT_PLATE_HEIGHT_MIDDLE - ROOF_HEIGHT
 SIDE_PLATE_HEIGHT = FRONT_PLATE_HEIGHT_SIDE + BIRDHOUSE_SPACE_BOTTOM
 BACK_PLATE_HEIGHT = SIDE_PLATE_HEIGHT - BIRDHOUSE_SPACE_TOP
+SLIDE_HEIGHT_MID = BACK_PLATE_HEIGHT * 0.7  # mm
+
+ENTRANCE_HOLE_RADIUS = BIRDHOUSE_WIDTH_INNER / 6  # mm
+ENTRANCE_HOLE_HEIGHTS = (
+    FRONT_PLATE_HEIGHT_MIDDLE * 0.5,
+    FRONT_PLATE_HEIGHT_MIDDLE * 0.75,
+)  # mm
+
+CONNECTOR_PITCH = WALLTHICKNESS * 2  # mm, connector width and spacing along an edge
@@ -0,0 +1,156 @@
+"""
+exports — write the birdhouse parts to DXF files for laser cutting.
+
+This module provides export_all(jobs), which takes (part, path) pairs of
+Workplanes or Sketches and exports them one after the other, or in parallel
+worker processes with export_all(jobs, parallel=True).
+
+Notes:
+- The DXF conversion of a part takes a few milliseconds, much less than starting
+  a worker process and importing cadquery into it, so the serial export is the
+  default. The pool only pays off for many or very large parts.
+- Only the plane and the shapes of each part are sent to the workers; the
+  Workplane history (parent chain) is dropped before pickling.
+- Every file is written to a temporary name first and then renamed into place
+  (safe_export), so readers never see a partially written DXF.
+- Exports are cached on disk in CACHE_DIR, keyed on a hash of the geometry
+  (cached_export); unchanged parts are copied from there instead of re-exported.
+  Delete the directory to force a fresh export.
+- With parallel=True on platforms that spawn worker processes (Windows, macOS)
+  the calling script must guard its entry point with `if __name__ == "__main__":`.
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import List, Sequence, Tuple, Union
+
+import cadquery
+from cadquery import cq
+
+# exported files are stored here under the hash of their geometry
+CACHE_DIR = os.path.join(".cache", "dxf")
+
+
+def safe_export(shape: cq.Workplane, path: str) -> None:
+    """
+    Export a Workplane to a temporary file next to path and move it into place.
+    The rename is atomic, so an interrupted run never leaves a truncated file at path.
+    """
+    # imported here so that importing this module stays cheap for callers that never export
+    from cadquery import exporters  # pylint: disable=import-outside-toplevel
+
+    root, ext = os.path.splitext(path)
+    # keep the extension, the export type is derived from it
+    tmp = f"{root}.tmp{ext}"
+    try:
+        exporters.export(shape, tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _copy_atomic(src: str, dst: str) -> None:
+    """Copy src to a temporary file next to dst and move it into place."""
+    tmp = f"{dst}.tmp"
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _export_key(shape: cq.Workplane) -> str:
+    """
+    Return a hex digest identifying the export of a Workplane: the BREP of its shapes, its
+    plane (DXF output is projected onto it) and the cadquery version.
+    """
+    brep = BytesIO()
+    cq.Compound.makeCompound(shape.vals()).exportBrep(brep)
+
+    plane = shape.plane
+    h = hashlib.blake2b(brep.getvalue(), digest_size=16)
+    h.update(repr((plane.origin.toTuple(), plane.xDir.toTuple(), plane.zDir.toTuple())).encode())
+    h.update(cadquery.__version__.encode())
+    return h.hexdigest()
+
+
+def cached_export(shape: cq.Workplane, path: str, cachedir: str = CACHE_DIR) -> bool:
+    """
+    Export a Workplane like safe_export, reusing an earlier export of identical geometry.
+    ----------
+    Parameters
+    ----------
+    shape : cq.Workplane
+        The part to export.
+    path : str
+        Target path; the export type is derived from the file extension.
+    cachedir : str, optional
+        Directory holding the cached exports (default: CACHE_DIR).
+    Returns
+    -------
+    bool
+        True if the file was copied from the cache, False if it was exported.
+    """
+    ext = os.path.splitext(path)[1]
+    cached = os.path.join(cachedir, _export_key(shape) + ext)
+    if os.path.exists(cached):
+        _copy_atomic(cached, path)
+        return True
+
+    safe_export(shape, path)
+    os.makedirs(cachedir, exist_ok=True)
+    _copy_atomic(path, cached)
+    return False
+
+
+def _export(job: Tuple[cq.Plane, List[cq.Shape], str]) -> str:
+    """Export a single (plane, shapes, path) job and return the written path."""
+    plane, shapes, path = job
+    cached_export(cq.Workplane(plane).add(shapes), path)
+    return path
+
+
+def _payload(
+    part: Union[cq.Workplane, cq.Sketch], path: str
+) -> Tuple[cq.Plane, List[cq.Shape], str]:
+    """Reduce a part to the (plane, shapes, path) job sent to the workers."""
+    if isinstance(part, cq.Sketch):
+        return cq.Plane.named("XY"), list(part), path
+
+    # strip the Workplane history, the workers only need the plane and the shapes
+    return part.plane, part.vals(), path
+
+
+def export_all(
+    jobs: Sequence[Tuple[Union[cq.Workplane, cq.Sketch], str]], parallel: bool = False
+) -> List[str]:
+    """
+    Export Workplanes or Sketches to files.
+    ----------
+    Parameters
+    ----------
+    jobs : sequence of (cq.Workplane or cq.Sketch, str)
+        Pairs of the part to export and the target path. The export type is derived from
+        the file extension, as with cadquery.exporters.export. Sketches are exported in
+        their own XY plane.
+    parallel : bool, optional
+        Export in worker processes instead of in this process (default: False).
+    Returns
+    -------
+    list of str
+        The written paths, in the order of the given jobs.
+    """
+    if not jobs:
+        return []
+
+    payload = [_payload(part, path) for part, path in jobs]
+    if not parallel:
+        return [_export(job) for job in payload]
+
+    with ProcessPoolExecutor(max_workers=min(len(payload), os.cpu_count() or 1)) as ex:
+        return list(ex.map(_export, payload))
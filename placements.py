@@ -0,0 +1,70 @@
+"""
+placements — where the slides sit inside the birdhouse.
+
+This module holds the placement of the bottom, mid and top slide as plain data
+(SLIDE_PLACEMENTS) and provides slide_points(name, ys, z), which maps points of a
+flat slide into the (y, z) plane of the side plate. Both the 3D model
+(place_slides in birdhouse.py) and the 2D side plate profile (profiles.py) use
+it, so the slide layout is defined in one place.
+
+Notes:
+- Only a handful of connector centers are transformed per slide, so the
+  transform is plain Python math.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+from constants import (
+    WALLTHICKNESS,
+    BIRDHOUSE_DEPTH,
+    SLIDE_LENGTH_TOP,
+    SLIDE_ANGLE,
+    SLIDE_HEIGHT_MID,
+    BACK_PLATE_HEIGHT,
+)
+
+# name -> (rotation about the X axis in degrees, Y shift applied before the rotation,
+#          (y, z) offset applied after the rotation); every slide is also moved by
+#          WALLTHICKNESS along X to sit between the side plates
+SLIDE_PLACEMENTS: Dict[str, Tuple[float, float, Tuple[float, float]]] = {
+    "bottom": (SLIDE_ANGLE, 0.0, (0.0, 0.0)),
+    "mid": (-SLIDE_ANGLE, 0.0, (WALLTHICKNESS, SLIDE_HEIGHT_MID)),
+    "top": (
+        SLIDE_ANGLE,
+        -SLIDE_LENGTH_TOP,
+        (BIRDHOUSE_DEPTH - WALLTHICKNESS, BACK_PLATE_HEIGHT - WALLTHICKNESS),
+    ),
+}
+
+
+def slide_points(name: str, ys: Sequence[float], z: float) -> List[Tuple[float, float]]:
+    """
+    Map points of a flat slide into the (y, z) plane of the side plate.
+    ----------
+    Parameters
+    ----------
+    name : str
+        One of the keys of SLIDE_PLACEMENTS ("bottom", "mid", "top").
+    ys : sequence of float
+        Y coordinates of the points on the flat slide.
+    z : float
+        Z coordinate of the points on the flat slide (the same for all of them).
+    Returns
+    -------
+    list of (float, float)
+        The (y, z) coordinates of the points after placing the slide.
+    """
+    angle, shift, (offset_y, offset_z) = SLIDE_PLACEMENTS[name]
+    a = math.radians(angle)
+    cos_a = math.cos(a)
+    sin_a = math.sin(a)
+
+    # shift along Y, rotate about the X axis, then offset
+    return [
+        (
+            (y + shift) * cos_a - z * sin_a + offset_y,
+            (y + shift) * sin_a + z * cos_a + offset_z,
+        )
+        for y in ys
+    ]
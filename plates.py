@@ -0,0 +1,91 @@
+"""
+plates — shared plate builders for the birdhouse model.
+
+This module provides build_side_plate(front_plate, back_plate, slides), which cuts
+the connector slots of all adjoining parts out of the side plate and returns the
+left and right side plate.
+
+Notes:
+- Results are memoized on a BLAKE2 hash of the BREP serialization of the cutting
+  tools, so scripts that build identical front/back plates and slides (even as new
+  Workplane objects) reuse the already cut side plates.
+- Intended for use with CadQuery and the constants from constants.py.
+"""
+
+import hashlib
+from io import BytesIO
+from typing import Dict, Sequence, Tuple
+
+from cadquery import cq
+
+from constants import (
+    WALLTHICKNESS,
+    BIRDHOUSE_WIDTH,
+    BIRDHOUSE_DEPTH,
+    SIDE_PLATE_HEIGHT,
+)
+
+_SIDE_PLATE_CACHE: Dict[str, Tuple[cq.Workplane, cq.Workplane]] = {}
+
+
+def _brep_digest(shape: cq.Shape) -> str:
+    """Return a hex digest of the BREP serialization of a shape."""
+    brep = BytesIO()
+    shape.exportBrep(brep)
+    return hashlib.blake2b(brep.getvalue(), digest_size=16).hexdigest()
+
+
+def build_side_plate(
+    front_plate: cq.Workplane,
+    back_plate: cq.Workplane,
+    slides: Sequence[cq.Workplane],
+) -> Tuple[cq.Workplane, cq.Workplane]:
+    """
+    Create the left and right side plates with the connector cutouts of all adjoining parts.
+    ----------
+    Parameters
+    ----------
+    front_plate : cq.Workplane
+        The front plate in its final position.
+    back_plate : cq.Workplane
+        The back plate in its final position.
+    slides : sequence of cq.Workplane
+        The slides in their final position.
+    Returns
+    -------
+    tuple of cq.Workplane
+        (side_plate, side_plate2): the left side plate on the "YZ" plane and a copy
+        translated to the right side of the birdhouse.
+    Notes
+    -----
+    - The result is memoized on the BREP hash of the cutting tools; callers must not rely
+      on getting new Workplane objects back.
+    """
+    # largest tools first, so the boolean meets the big overlaps before the small ones
+    tools = cq.Compound.makeCompound(
+        sorted(
+            [front_plate.val(), back_plate.val(), *(slide.val() for slide in slides)],
+            key=lambda shape: shape.BoundingBox().DiagonalLength,
+            reverse=True,
+        )
+    )
+    key = _brep_digest(tools)
+    if key in _SIDE_PLATE_CACHE:
+        return _SIDE_PLATE_CACHE[key]
+
+    side_plate = (
+        cq.Workplane("YZ")
+        .lineTo(0, SIDE_PLATE_HEIGHT)
+        .lineTo(BIRDHOUSE_DEPTH, SIDE_PLATE_HEIGHT)
+        .lineTo(BIRDHOUSE_DEPTH, 0)
+        .close()
+        .extrude(WALLTHICKNESS)
+    )
+
+    # cut out connector shapes from side plates in a single boolean operation; the
+    # boolean adds pcurves to the tool edges, so cut a copy to keep the key stable
+    side_plate = side_plate.cut(tools.copy())
+    side_plate2 = side_plate.translate((BIRDHOUSE_WIDTH - WALLTHICKNESS, 0, 0))
+
+    _SIDE_PLATE_CACHE[key] = (side_plate, side_plate2)
+    return side_plate, side_plate2
@@ -0,0 +1,178 @@
+"""
+profiles — 2D laser-cut profiles of the birdhouse parts.
+
+This module builds every part as a cq.Sketch in the part's own plane: the plate
+outline, the connectors sticking out of its edges and the slots / holes cut into
+it. These sketches are what the DXF files for laser cutting are exported from,
+so no 3D extrusion or 3D Boolean operation is needed for the export.
+
+Notes:
+- Coordinates are local to each part (origin at the lower left corner of the
+  plate), in the units of constants.py (typically millimeters).
+- The slide slots in the side plate are placed with placements.py, like the 3D
+  slides. The front and back plate slots follow build_front_plate() and
+  build_back_plate() in birdhouse.py; run `python birdhouse.py --check` after
+  changing the layout to verify that profiles and 3D parts still agree.
+- All builders are memoized; the returned sketches must not be modified.
+"""
+
+import functools
+from typing import Dict, Iterable, List, Tuple
+
+from cadquery import cq
+
+from connectors import connector_positions
+from placements import SLIDE_PLACEMENTS, slide_points
+from constants import (
+    WALLTHICKNESS,
+    BIRDHOUSE_DEPTH,
+    BIRDHOUSE_WIDTH_INNER,
+    BIRDHOUSE_SPACE_BOTTOM,
+    SLIDE_LENGTH_MID,
+    SLIDE_LENGTH_TOP,
+    SLIDE_LENGTH_BOTTOM,
+    FRONT_PLATE_HEIGHT_SIDE,
+    FRONT_PLATE_HEIGHT_MIDDLE,
+    BACK_PLATE_HEIGHT,
+    SIDE_PLATE_HEIGHT,
+    ROOF_LENGTH,
+    ENTRANCE_HOLE_RADIUS,
+    ENTRANCE_HOLE_HEIGHTS,
+    CONNECTOR_PITCH,
+)
+
+
+def _side_connectors(
+    sketch: cq.Sketch, length: float, start: int
+) -> cq.Sketch:
+    """Add a connector row to both long edges (x = 0 and x = BIRDHOUSE_WIDTH_INNER)."""
+    ys = connector_positions(length, start)
+    points = [(x, y) for x in (0, BIRDHOUSE_WIDTH_INNER) for y in ys]
+    if not points:
+        return sketch
+    return sketch.push(points).rect(CONNECTOR_PITCH, WALLTHICKNESS).reset()
+
+
+@functools.lru_cache(maxsize=None)
+def front_plate_profile() -> cq.Sketch:
+    """Create the front plate outline with entrance holes and connectors."""
+    # counterclockwise, so the face normal matches the connector faces and clean()
+    # can merge them into one outline
+    sketch = cq.Sketch().polygon(
+        [
+            (0, 0),
+            (BIRDHOUSE_WIDTH_INNER, 0),
+            (BIRDHOUSE_WIDTH_INNER, FRONT_PLATE_HEIGHT_SIDE),
+            (BIRDHOUSE_WIDTH_INNER + WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE),
+            (BIRDHOUSE_WIDTH_INNER / 2, FRONT_PLATE_HEIGHT_MIDDLE),
+            (-WALLTHICKNESS, FRONT_PLATE_HEIGHT_SIDE),
+            (0, FRONT_PLATE_HEIGHT_SIDE),
+        ]
+    )
+    sketch = _side_connectors(sketch, FRONT_PLATE_HEIGHT_SIDE, start=0)
+    return (
+        sketch.push([(BIRDHOUSE_WIDTH_INNER / 2, z) for z in ENTRANCE_HOLE_HEIGHTS])
+        .circle(ENTRANCE_HOLE_RADIUS, mode="s")
+        .reset()
+        .clean()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def back_plate_profile() -> cq.Sketch:
+    """Create the back plate outline with connectors."""
+    sketch = cq.Sketch().push([(BIRDHOUSE_WIDTH_INNER / 2, BACK_PLATE_HEIGHT / 2)])
+    sketch = sketch.rect(BIRDHOUSE_WIDTH_INNER, BACK_PLATE_HEIGHT).reset()
+    return _side_connectors(sketch, FRONT_PLATE_HEIGHT_SIDE, start=1).clean()
+
+
+def _slide_profile(length: float, start: int) -> cq.Sketch:
+    """Create a slide outline of the given length with connectors."""
+    sketch = cq.Sketch().push([(BIRDHOUSE_WIDTH_INNER / 2, length / 2)])
+    sketch = sketch.rect(BIRDHOUSE_WIDTH_INNER, length).reset()
+    return _side_connectors(sketch, length, start).clean()
+
+
+@functools.lru_cache(maxsize=None)
+def slide_profiles() -> Tuple[cq.Sketch, cq.Sketch, cq.Sketch]:
+    """Create the bottom, mid and top slide outlines with connectors."""
+    return (
+        _slide_profile(SLIDE_LENGTH_BOTTOM, start=0),
+        _slide_profile(SLIDE_LENGTH_MID, start=1),
+        _slide_profile(SLIDE_LENGTH_TOP, start=0),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def side_plate_profile() -> cq.Sketch:
+    """Create the side plate outline with the slots for all adjoining connectors."""
+    slots: List[Tuple[Tuple[float, float], float]] = []
+
+    # front and back plate connectors, see build_front_plate / build_back_plate
+    slots += [
+        ((WALLTHICKNESS / 2, BIRDHOUSE_SPACE_BOTTOM + y), 0.0)
+        for y in connector_positions(FRONT_PLATE_HEIGHT_SIDE, start=0)
+    ]
+    slots += [
+        ((BIRDHOUSE_DEPTH - WALLTHICKNESS / 2, y), 0.0)
+        for y in connector_positions(FRONT_PLATE_HEIGHT_SIDE, start=1)
+    ]
+
+    # slide connectors, placed like the slides themselves (see placements.py)
+    for name, length, start in (
+        ("bottom", SLIDE_LENGTH_BOTTOM, 0),
+        ("mid", SLIDE_LENGTH_MID, 1),
+        ("top", SLIDE_LENGTH_TOP, 0),
+    ):
+        angle = SLIDE_PLACEMENTS[name][0]
+        centers = slide_points(
+            name, connector_positions(length, start), WALLTHICKNESS / 2
+        )
+        slots += [(center, angle) for center in centers]
+
+    sketch = cq.Sketch().push([(BIRDHOUSE_DEPTH / 2, SIDE_PLATE_HEIGHT / 2)])
+    sketch = sketch.rect(BIRDHOUSE_DEPTH, SIDE_PLATE_HEIGHT).reset()
+    return _cut_slots(sketch, slots).clean()
+
+
+def _cut_slots(
+    sketch: cq.Sketch, slots: Iterable[Tuple[Tuple[float, float], float]]
+) -> cq.Sketch:
+    """Cut square WALLTHICKNESS slots, given as (center, angle), out of a sketch."""
+    # one 2D cut per slot angle
+    by_angle: Dict[float, List[Tuple[float, float]]] = {}
+    for center, angle in slots:
+        by_angle.setdefault(angle, []).append(center)
+
+    for angle, centers in by_angle.items():
+        sketch = sketch.push(centers)
+        sketch = sketch.rect(WALLTHICKNESS, WALLTHICKNESS, angle=angle, mode="s").reset()
+    return sketch
+
+
+@functools.lru_cache(maxsize=None)
+def roof_left_profile() -> cq.Sketch:
+    """Create the left roof outline with connectors along the ridge edge."""
+    ys = connector_positions(BIRDHOUSE_DEPTH, start=1)
+    sketch = cq.Sketch().push([(ROOF_LENGTH / 2, BIRDHOUSE_DEPTH / 2)])
+    sketch = sketch.rect(ROOF_LENGTH, BIRDHOUSE_DEPTH).reset()
+    if ys:
+        sketch = sketch.push([(ROOF_LENGTH, y) for y in ys])
+        sketch = sketch.rect(CONNECTOR_PITCH, WALLTHICKNESS).reset()
+    return sketch.clean()
+
+
+@functools.lru_cache(maxsize=None)
+def roof_right_profile() -> cq.Sketch:
+    """
+    Create the right roof outline. It reaches WALLTHICKNESS past the ridge; the left
+    roof connectors cut slots of WALLTHICKNESS x WALLTHICKNESS into that overhang.
+    """
+    length = ROOF_LENGTH + WALLTHICKNESS
+    sketch = cq.Sketch().push([(length / 2, BIRDHOUSE_DEPTH / 2)])
+    sketch = sketch.rect(length, BIRDHOUSE_DEPTH).reset()
+    slots = [
+        ((WALLTHICKNESS / 2, y), 0.0)
+        for y in connector_positions(BIRDHOUSE_DEPTH, start=1)
+    ]
+    return _cut_slots(sketch, slots).clean()